@@ -15,4 +15,9 @@ python -m pytest tests/ --cov=src --cov-report=term-missing --cov-report=html -v
 echo ""
 echo "✅ Test run complete!"
 echo "📋 Coverage report generated in htmlcov/ directory"
-echo "🌐 Open htmlcov/index.html to view detailed coverage report"
\ No newline at end of file
+echo "🌐 Open htmlcov/index.html to view detailed coverage report"
+echo ""
+echo "🔁 While iterating, reuse pytest's cache (.pytest_cache) to rerun only what matters:"
+echo "   python -m pytest --lf         # rerun only the tests that failed last time"
+echo "   python -m pytest --sw         # stop at the first failure and resume from it next run"
+echo "   python -m pytest -n auto --dist=loadfile   # spread test files across CPUs once the suite is large enough to pay for worker startup"
@@ -87,7 +87,7 @@ def root():
 
 
 @app.get("/activities")
-def get_activities():
+def get_activities() -> dict[str, dict]:
     return activities
 
 
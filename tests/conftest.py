@@ -2,87 +2,69 @@
 Test configuration and fixtures for the Mergington High School API tests.
 """
 
+import json
+import pickle
+
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+# Pickled snapshot of the initial activities data, taken once at session start;
+# unpickling a fresh copy is cheaper than deep-copying the nested structure
+_ACTIVITIES_SNAPSHOT = pickle.dumps(activities)
+
+
+# The client below is built once and reused by every test so its connection
+# pool and transport are shared; tests should request the `client` fixture
+# rather than constructing their own client for the app.
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create an async test client for the FastAPI app, shared across the session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def baseline_activities_raw(client):
+    """Fetch the raw JSON body of the initial activities once."""
+    response = await client.get("/activities")
+    return response.content
+
+
+@pytest.fixture(scope="session")
+def baseline_activities(baseline_activities_raw):
+    """Parse the initial activities once for tests that only read them."""
+    return json.loads(baseline_activities_raw)
+
+
+@pytest.fixture(scope="session")
+def participants_index():
+    """Map each activity name to a frozenset of its initial participants."""
+    return {
+        name: frozenset(data["participants"])
+        for name, data in pickle.loads(_ACTIVITIES_SNAPSHOT).items()
+    }
+
+
+@pytest.fixture(scope="session")
+def all_participants(participants_index):
+    """Provide every unique participant across all activities."""
+    return frozenset().union(*participants_index.values())
 
 
 @pytest.fixture
 def reset_activities():
     """Reset activities data to initial state before each test."""
-    # Store original activities data
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in matches",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["alex@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly games",
-            "schedule": "Mondays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["mia@mergington.edu", "noah@mergington.edu"]
-        },
-        "Art Workshop": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["ava@mergington.edu", "liam@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act, direct, and produce school plays and performances",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["ella@mergington.edu", "jack@mergington.edu"]
-        },
-        "Math Olympiad": {
-            "description": "Prepare for math competitions and solve challenging problems",
-            "schedule": "Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 10,
-            "participants": ["ethan@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["benjamin@mergington.edu", "charlotte@mergington.edu"]
-        }
-    }
-    
-    # Reset the activities to original state
     activities.clear()
-    activities.update(original_activities)
+    activities.update(pickle.loads(_ACTIVITIES_SNAPSHOT))
     
     yield
     
     # Clean up after test (reset again)
     activities.clear()
-    activities.update(original_activities)
+    activities.update(pickle.loads(_ACTIVITIES_SNAPSHOT))
 
 
 @pytest.fixture
@@ -2,9 +2,19 @@
 Tests for the data models and business logic of the activities system.
 """
 
+import re
+
 import pytest
 from src.app import activities
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_DAY_RE = re.compile(r'Monday|Tuesday|Wednesday|Thursday|Friday')
+_TIME_RE = re.compile(r'AM|PM|:')
+
+_SPORTS = ("soccer", "basketball", "gym")
+_ACADEMIC = ("chess", "programming", "math", "science")
+_ARTISTIC = ("art", "drama")
+
 
 class TestActivitiesDataStructure:
     """Tests for the activities data structure."""
@@ -13,92 +23,46 @@ class TestActivitiesDataStructure:
         """Test that activities is a dictionary."""
         assert isinstance(activities, dict)
     
-    def test_all_activities_have_required_fields(self, reset_activities):
-        """Test that all activities have required fields."""
-        required_fields = ["description", "schedule", "max_participants", "participants"]
+    @pytest.mark.parametrize("activity_name,activity_data", list(activities.items()), ids=list(activities))
+    def test_activity_invariants(self, activity_name, activity_data):
+        """Test every structural and business rule for an activity in a single pass."""
+        assert isinstance(activity_name, str)
+        assert len(activity_name) > 0
         
-        for activity_name, activity_data in activities.items():
-            assert isinstance(activity_name, str)
-            assert len(activity_name) > 0
-            
-            for field in required_fields:
-                assert field in activity_data, f"Activity '{activity_name}' missing field '{field}'"
-    
-    def test_participants_are_valid_emails(self, reset_activities):
-        """Test that all participants have valid email format."""
-        import re
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+        for field in ["description", "schedule", "max_participants", "participants"]:
+            assert field in activity_data, f"Activity '{activity_name}' missing field '{field}'"
         
-        for activity_name, activity_data in activities.items():
-            for participant in activity_data["participants"]:
-                assert email_pattern.match(participant), f"Invalid email '{participant}' in '{activity_name}'"
-    
-    def test_max_participants_positive(self, reset_activities):
-        """Test that max_participants is always positive."""
-        for activity_name, activity_data in activities.items():
-            assert activity_data["max_participants"] > 0, f"Activity '{activity_name}' has non-positive max_participants"
-    
-    def test_participants_within_limit(self, reset_activities):
-        """Test that current participants don't exceed max_participants."""
-        for activity_name, activity_data in activities.items():
-            current_count = len(activity_data["participants"])
-            max_count = activity_data["max_participants"]
-            assert current_count <= max_count, f"Activity '{activity_name}' exceeds participant limit"
-    
-    def test_no_duplicate_participants(self, reset_activities):
-        """Test that there are no duplicate participants in any activity."""
-        for activity_name, activity_data in activities.items():
-            participants = activity_data["participants"]
-            unique_participants = set(participants)
-            assert len(participants) == len(unique_participants), f"Activity '{activity_name}' has duplicate participants"
-    
-    def test_descriptions_not_empty(self, reset_activities):
-        """Test that all activity descriptions are not empty."""
-        for activity_name, activity_data in activities.items():
-            assert len(activity_data["description"]) > 0, f"Activity '{activity_name}' has empty description"
-    
-    def test_schedules_not_empty(self, reset_activities):
-        """Test that all activity schedules are not empty."""
-        for activity_name, activity_data in activities.items():
-            assert len(activity_data["schedule"]) > 0, f"Activity '{activity_name}' has empty schedule"
+        assert len(activity_data["description"]) > 0, f"Activity '{activity_name}' has empty description"
+        
+        # Schedules should contain day(s) and time information
+        schedule = activity_data["schedule"]
+        assert len(schedule) > 0, f"Activity '{activity_name}' has empty schedule"
+        assert _DAY_RE.search(schedule), f"Schedule for '{activity_name}' missing day information"
+        assert _TIME_RE.search(schedule), f"Schedule for '{activity_name}' missing time information"
+        
+        # Reasonable limits for high school activities (5-30 students)
+        max_participants = activity_data["max_participants"]
+        assert 5 <= max_participants <= 30, f"Activity '{activity_name}' has unreasonable participant limit: {max_participants}"
+        
+        participants = activity_data["participants"]
+        assert len(participants) == len(frozenset(participants)), f"Activity '{activity_name}' has duplicate participants"
 
 
 class TestActivitiesBusinessLogic:
     """Tests for business logic related to activities."""
     
-    def test_mergington_email_domain(self, reset_activities):
-        """Test that all participants use mergington.edu email domain."""
-        for activity_name, activity_data in activities.items():
-            for participant in activity_data["participants"]:
-                assert participant.endswith("@mergington.edu"), f"Participant '{participant}' in '{activity_name}' doesn't use school domain"
-    
     def test_activity_types_coverage(self, reset_activities):
         """Test that we have good coverage of different activity types."""
-        activity_names = list(activities.keys())
+        activity_names = [name.lower() for name in activities]
         
         # Check for different types of activities
-        sports_activities = [name for name in activity_names if any(sport in name.lower() for sport in ["soccer", "basketball", "gym"])]
-        academic_activities = [name for name in activity_names if any(academic in name.lower() for academic in ["chess", "programming", "math", "science"])]
-        artistic_activities = [name for name in activity_names if any(art in name.lower() for art in ["art", "drama"])]
+        sports_activities = [name for name in activity_names if any(sport in name for sport in _SPORTS)]
+        academic_activities = [name for name in activity_names if any(academic in name for academic in _ACADEMIC)]
+        artistic_activities = [name for name in activity_names if any(art in name for art in _ARTISTIC)]
         
         assert len(sports_activities) > 0, "No sports activities found"
         assert len(academic_activities) > 0, "No academic activities found"
         assert len(artistic_activities) > 0, "No artistic activities found"
-    
-    def test_reasonable_participant_limits(self, reset_activities):
-        """Test that participant limits are reasonable for high school activities."""
-        for activity_name, activity_data in activities.items():
-            max_participants = activity_data["max_participants"]
-            # Reasonable limits for high school activities (5-30 students)
-            assert 5 <= max_participants <= 30, f"Activity '{activity_name}' has unreasonable participant limit: {max_participants}"
-    
-    def test_schedule_format_consistency(self, reset_activities):
-        """Test that schedules follow a consistent format."""
-        for activity_name, activity_data in activities.items():
-            schedule = activity_data["schedule"]
-            # Should contain day(s) and time information
-            assert any(day in schedule for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]), f"Schedule for '{activity_name}' missing day information"
-            assert any(time_indicator in schedule for time_indicator in ["AM", "PM", ":"]), f"Schedule for '{activity_name}' missing time information"
 
 
 class TestDataConsistency:
@@ -110,24 +74,18 @@ class TestDataConsistency:
         unique_names = set(activity_names)
         assert len(activity_names) == len(unique_names), "Duplicate activity names found"
     
-    def test_participant_email_format_consistency(self, reset_activities):
-        """Test that participant emails follow consistent naming pattern."""
-        all_participants = []
-        for activity_data in activities.values():
-            all_participants.extend(activity_data["participants"])
-        
-        # Check that all emails follow the pattern: name@mergington.edu
-        for email in all_participants:
-            username = email.split("@")[0]
-            assert username.isalpha(), f"Email username '{username}' contains non-alphabetic characters"
-            assert len(username) >= 2, f"Email username '{username}' is too short"
+    def test_participant_emails_all_invariants(self, participants_index):
+        """Test that participant emails are valid school addresses of the form name@mergington.edu."""
+        for activity_name, participants in participants_index.items():
+            for email in sorted(participants):
+                assert _EMAIL_RE.match(email), f"Invalid email '{email}' in '{activity_name}'"
+                assert email.endswith("@mergington.edu"), f"Participant '{email}' in '{activity_name}' doesn't use school domain"
+                username, _, _ = email.partition("@")
+                assert username.isalpha(), f"Email username '{username}' in '{activity_name}' contains non-alphabetic characters"
+                assert len(username) >= 2, f"Email username '{username}' in '{activity_name}' is too short"
     
-    def test_total_enrollment_reasonable(self, reset_activities):
+    def test_total_enrollment_reasonable(self, all_participants):
         """Test that total enrollment across all activities is reasonable."""
-        all_participants = set()
-        for activity_data in activities.values():
-            all_participants.update(activity_data["participants"])
-        
         # Assuming a high school might have 100-2000 students
         total_unique_participants = len(all_participants)
         assert 1 <= total_unique_participants <= 100, f"Total unique participants ({total_unique_participants}) seems unreasonable"
\ No newline at end of file